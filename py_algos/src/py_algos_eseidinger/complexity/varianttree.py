@@ -6,10 +6,120 @@ The conditionals are used to test if a variant satisfies a condition and to get
 in the condition.
 """
 
+import sys
 from typing import Generic, Optional, Protocol, Self, TypeVar, Any
-from sympy import symbols, Symbol  # type: ignore
+from collections import deque
+from functools import lru_cache
+import numpy as np
+from sympy import symbols, lambdify, Symbol  # type: ignore
 from sympy.logic.boolalg import Boolean, Or, to_dnf  # type: ignore
 
+try:
+    # numba is optional; plain numpy evaluation works everywhere
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+
+_assignment_bits_cache: dict[int, np.ndarray] = {}
+
+
+def _assignment_bits(number_of_symbols: int) -> np.ndarray:
+    """Return the boolean assignment matrix for a number of symbols
+    Row i of the matrix is the binary representation of i, with the first
+    column being the most significant bit. The matrix is cached since all
+    conditions over the same number of symbols share it.
+    """
+    bits = _assignment_bits_cache.get(number_of_symbols)
+    if bits is None:
+        rows = np.arange(2**number_of_symbols)[:, None]
+        columns = np.arange(number_of_symbols - 1, -1, -1)
+        bits = ((rows >> columns) & 1).astype(bool)
+        _assignment_bits_cache[number_of_symbols] = bits
+    return bits
+
+
+def _filter_possible_kernel(
+    set_masks: np.ndarray,
+    val_masks: np.ndarray,
+    poss_set: np.ndarray,
+    poss_val: np.ndarray,
+) -> np.ndarray:
+    """Test many partial variants against the possible-variant masks
+    All arguments are uint64 mask arrays. Entry i of the result is True if
+    any possible variant is derived from or equal to the i-th variant.
+    The loop body is pure integer arithmetic, so it is compiled with numba
+    when the package is available.
+    """
+    out = np.empty(len(set_masks), dtype=np.bool_)
+    for i in range(len(set_masks)):  # pylint: disable=consider-using-enumerate
+        possible = False
+        for j in range(len(poss_set)):  # pylint: disable=consider-using-enumerate
+            if (set_masks[i] & ~poss_set[j]) == 0 and (
+                set_masks[i] & (val_masks[i] ^ poss_val[j])
+            ) == 0:
+                possible = True
+                break
+        out[i] = possible
+    return out
+
+
+if njit is not None:
+    _filter_possible_kernel = njit(cache=True)(_filter_possible_kernel)
+
+
+def filter_possible_variants(
+    variants: list["Variant"], possible_variants: list["Variant"]
+) -> list[bool]:
+    """Test a batch of variants for possibility in one kernel call
+    Equivalent to calling is_possible on every variant, but the packed mask
+    arrays of both lists are handed to a single integer kernel. Falls back
+    to the per-variant path if the variants cannot be packed.
+    """
+    packed_possible = _packed_variant_masks(tuple(possible_variants))
+    packed_variants = _packed_variant_masks(tuple(variants))
+    if (
+        packed_possible is not None
+        and packed_variants is not None
+        and packed_possible[0] == packed_variants[0]
+    ):
+        result = _filter_possible_kernel(
+            packed_variants[1],
+            packed_variants[2],
+            packed_possible[1],
+            packed_possible[2],
+        )
+        return [bool(value) for value in result]
+    return [variant.is_possible(possible_variants) for variant in variants]
+
+
+@lru_cache(maxsize=None)
+def _packed_variant_masks(
+    variants: tuple["Variant", ...],
+) -> Optional[tuple[tuple[Symbol, ...], np.ndarray, np.ndarray]]:
+    """Pack the set/value bitmasks of variants into uint64 arrays
+    Returns the shared sorted symbol tuple together with one array of set
+    masks and one array of value masks. Returns None if the variants do not
+    share a single symbol tuple or do not fit into 64 bits, in which case
+    callers fall back to the per-variant comparison.
+    The result is cached per variant tuple since the same list of possible
+    variants is tested against many partial variants during tree construction.
+    """
+    masks = [variant._get_masks() for variant in variants]  # pylint: disable=protected-access
+    symbol_keys = {mask[0] for mask in masks}
+    if len(symbol_keys) != 1:
+        return None
+    symbols_key = next(iter(symbol_keys))
+    if len(symbols_key) > 64:
+        return None
+    set_masks = np.fromiter(
+        (mask[1] for mask in masks), dtype=np.uint64, count=len(masks)
+    )
+    val_masks = np.fromiter(
+        (mask[2] for mask in masks), dtype=np.uint64, count=len(masks)
+    )
+    return symbols_key, set_masks, val_masks
+
 
 class Attribute:  # pylint: disable=too-few-public-methods
     """
@@ -34,26 +144,67 @@ class Variant:
     """
     A class to represent a variant.
     A variant is a list of attributes.
+    Variants are treated as immutable once constructed: derive_variants
+    returns freshly built variants instead of modifying existing ones, which
+    allows the sorted attributes, the dictionary form and the bitmasks to be
+    cached on the instance.
     """
 
     def __init__(self, attributes: list[Attribute]):
         self.attributes = attributes
+        self._dict: Optional[dict[Symbol, Optional[bool]]] = None
+        self._sorted_attributes: Optional[list[Attribute]] = None
+        self._symbols_key: Optional[tuple[Symbol, ...]] = None
+        self._set_mask: int = 0
+        self._val_mask: int = 0
+
+    def _get_masks(self) -> tuple[tuple[Symbol, ...], int, int]:
+        """Return the sorted symbol tuple and the packed set/value bitmasks
+        Bit i corresponds to the i-th attribute in sorted symbol order.
+        A bit in the set mask is 1 if the attribute has a value, and the
+        corresponding bit in the value mask is 1 if that value is True.
+        The masks are computed lazily and cached.
+        """
+        if self._symbols_key is None:
+            set_mask = 0
+            val_mask = 0
+            sorted_symbols = []
+            for i, attr in enumerate(self.get_sorted_attributes()):
+                sorted_symbols.append(attr.symbol)
+                if attr.value is not None:
+                    set_mask |= 1 << i
+                    if attr.value:
+                        val_mask |= 1 << i
+            self._set_mask = set_mask
+            self._val_mask = val_mask
+            self._symbols_key = tuple(sorted_symbols)
+        return self._symbols_key, self._set_mask, self._val_mask
 
     def __str__(self):
         attributes = ", ".join(map(str, self.attributes))
         return f"{{{attributes}}}"
 
     def get_sorted_attributes(self) -> list[Attribute]:
-        """Return the attributes sorted by symbol"""
-        return sorted(self.attributes, key=lambda x: str(x.symbol))
+        """Return the attributes sorted by symbol
+        The sort runs once per variant and the result is cached.
+        """
+        if self._sorted_attributes is None:
+            self._sorted_attributes = sorted(
+                self.attributes, key=lambda x: str(x.symbol)
+            )
+        return self._sorted_attributes
 
     def to_dict(self) -> dict[Symbol, Optional[bool]]:
-        """Return a dictionary of the attributes"""
-        return {
-            attr.symbol: attr.value
-            for attr in self.attributes
-            if attr.value is not None
-        }
+        """Return a dictionary of the attributes
+        The dictionary is built once per variant and cached.
+        """
+        if self._dict is None:
+            self._dict = {
+                attr.symbol: attr.value
+                for attr in self.attributes
+                if attr.value is not None
+            }
+        return self._dict
 
     def __eq__(self, value):
         return isinstance(value, Variant) and self.to_dict() == value.to_dict()
@@ -77,6 +228,12 @@ class Variant:
         derived_variant.is_derived_from_or_equal(original_variant) == True
         original_variant.is_derived_from_or_equal(derived_variant) == False
         """
+        self_key, self_set, self_val = self._get_masks()
+        other_key, other_set, other_val = other_variant._get_masks()  # pylint: disable=protected-access
+        if self_key == other_key:
+            return (other_set & ~self_set) == 0 and (
+                other_set & (self_val ^ other_val)
+            ) == 0
         return all(
             self_attr.value == other_attr.value
             for self_attr, other_attr in zip(
@@ -102,22 +259,35 @@ class Variant:
         ]
         """
         new_variants = []
+        value_index = {sym: i for i, sym in enumerate(next_symbols)}
         for value in values:
-            new_attributes = [
-                Attribute(attr.symbol, attr.value) for attr in self.attributes
-            ]
-            new_variant = Variant(new_attributes)
-            for attribute in new_variant.attributes:
-                if attribute.symbol in next_symbols:
-                    index = next_symbols.index(attribute.symbol)
-                    attribute.value = value[index]
-            new_variants.append(new_variant)
+            new_attributes = []
+            for attr in self.attributes:
+                index = value_index.get(attr.symbol)
+                if index is None:
+                    new_attributes.append(Attribute(attr.symbol, attr.value))
+                else:
+                    new_attributes.append(Attribute(attr.symbol, value[index]))
+            new_variants.append(Variant(new_attributes))
         return new_variants
 
     def is_possible(self, possible_variants: list[Self]) -> bool:
         """Return True if the variant is possible
         This means that any of the possible variants is derived from or equal to this variant
+        The possible variants are packed into mask arrays once and the test
+        runs as a single vectorized expression over all candidates.
         """
+        packed = _packed_variant_masks(tuple(possible_variants))
+        if packed is not None:
+            symbols_key, poss_set, poss_val = packed
+            self_key, self_set, self_val = self._get_masks()
+            if self_key == symbols_key:
+                set_mask = np.uint64(self_set)
+                val_mask = np.uint64(self_val)
+                derived = ((set_mask & ~poss_set) == 0) & (
+                    (set_mask & (poss_val ^ val_mask)) == 0
+                )
+                return bool(derived.any())
         return any(
             possible_variant.is_derived_from_or_equal(self)
             for possible_variant in possible_variants
@@ -139,19 +309,11 @@ class Variant:
 
     def solves(self, condition: "Condition") -> bool:
         """Return True if the variant satisfies the condition
-        This method converts the condition to a list of possible variants
-        and checks if the variant is derived from or equal to any of the possible variants
+        Equivalent to matching the variant against the possible variants of
+        the condition, but evaluated through the condition's precomputed
+        truth table instead of its DNF terms.
         """
-        relevant_symbols = [
-            attribute.symbol
-            for attribute in self.attributes
-            if attribute.value is not None
-        ]
-        possible_variants = condition.to_possible_variants(relevant_symbols)
-        return any(
-            self.is_derived_from_or_equal(possible_variant)
-            for possible_variant in possible_variants
-        )
+        return condition.check(self)
 
 
 class Condition:  # pylint: disable=too-few-public-methods
@@ -164,27 +326,119 @@ class Condition:  # pylint: disable=too-few-public-methods
         self.lenient_conditions: dict[tuple[Symbol], Boolean] = {}
         self.condition = condition
         self.dnf = to_dnf(condition)
+        self.symbols: list[Symbol] = sorted(condition.free_symbols, key=str)
+        self._func = self._compile(condition)
+        self.truth_table: np.ndarray = self._get_truth_table()
+        self.minterms: set[int] = set(map(int, np.flatnonzero(self.truth_table)))
+        self._possible_variants_cache: dict[tuple[Symbol, ...], list[Variant]] = {}
+
+    def _compile(self, condition: Boolean):
+        """Lambdify the condition to a numpy-callable function
+        The function is additionally compiled with numba when available and
+        the generated code is accepted; otherwise the plain lambdified
+        function is used.
+        """
+        func = lambdify(self.symbols, condition, "numpy")
+        if njit is not None and len(self.symbols) > 0:
+            # generated functions have no source file, so no cache=True here
+            probe = np.zeros(2, dtype=bool)
+            try:
+                jitted = njit(func)
+                jitted(*[probe] * len(self.symbols))
+                return jitted
+            except Exception:  # pylint: disable=broad-exception-caught
+                # numba cannot lower every lambdified expression
+                pass
+        return func
+
+    def _get_truth_table(self) -> np.ndarray:
+        """Compute the dense truth table of the condition
+        Entry i of the returned boolean array is the value of the condition
+        for the assignment encoded by i, with the first symbol in the sorted
+        symbol list being the most significant bit.
+        The condition is evaluated over the whole assignment matrix in one
+        vectorized call instead of enumerating the truth table row by row.
+        """
+        if len(self.symbols) == 0:
+            return np.array([bool(self.condition)])
+        bits = _assignment_bits(len(self.symbols))
+        values = np.asarray(self._func(*bits.T), dtype=bool)
+        if values.ndim == 0:
+            # conditions that simplify to a constant broadcast to a scalar
+            values = np.full(len(bits), bool(values))
+        return values
 
     def check(self, variant: Variant) -> bool:
         """Check if the variant satisfies the condition
-        This method substitutes the values of the variant into the condition
-        and return the result.
+        This method projects the set attribute values of the variant onto the
+        precomputed minterms of the condition and checks whether any minterm
+        is compatible with them, i.e. whether any completion of the unset
+        attributes satisfies the condition.
         If the variant is empty, the result is True.
-        Otherwise, a boolean expression is created with the relevant symbols
-        and the values of the variant are substituted into the expression.
 
         For example:
         The boolean expression B & (A | C) would evaluate to True for the variant
         A = True, B = None, C = False
         because ignoring the value of B, the relevant expression is A | C
         """
-        return self.condition.subs(variant.to_dict())
+        variant_dict = variant.to_dict()
+        number_of_symbols = len(self.symbols)
+        set_mask = 0
+        set_values = 0
+        for i, sym in enumerate(self.symbols):
+            if sym in variant_dict:
+                bit = 1 << (number_of_symbols - 1 - i)
+                set_mask |= bit
+                if variant_dict[sym]:
+                    set_values |= bit
+        if set_mask == (1 << number_of_symbols) - 1:
+            # all condition symbols are set: a single truth-table lookup
+            return bool(self.truth_table[set_values])
+        return any(
+            (minterm & set_mask) == set_values for minterm in self.minterms
+        )
+
+    def _get_minterm_column_sums(self) -> np.ndarray:
+        """Return per-symbol counts of minterms in which the symbol is true
+        The minterms are expanded into a bit matrix and reduced column-wise
+        in numpy instead of decoding every minterm in Python.
+        """
+        number_of_symbols = len(self.symbols)
+        minterms = np.fromiter(
+            self.minterms, dtype=np.int64, count=len(self.minterms)
+        )
+        columns = np.arange(number_of_symbols - 1, -1, -1)
+        bits = (minterms[:, None] >> columns) & 1
+        return bits.sum(axis=0)
+
+    def get_relevant_symbols(self) -> list[Symbol]:
+        """Return the symbols that are true in at least one minterm"""
+        if len(self.minterms) == 0 or len(self.symbols) == 0:
+            return []
+        column_sums = self._get_minterm_column_sums()
+        return [self.symbols[i] for i in np.flatnonzero(column_sums > 0)]
+
+    def get_necessary_symbols(self) -> list[Symbol]:
+        """Return the symbols that are true in every minterm"""
+        if len(self.minterms) == 0 or len(self.symbols) == 0:
+            return []
+        column_sums = self._get_minterm_column_sums()
+        return [
+            self.symbols[i]
+            for i in np.flatnonzero(column_sums == len(self.minterms))
+        ]
 
     def to_possible_variants(self, relevant_symbols: list[Symbol]) -> list[Variant]:
         """Return the possible variants of the condition
         This method uses the DNF of the condition to get the possible variants
         The possible variants are the minterms of the DNF
+        The result is memoized per set of relevant symbols since the same
+        condition is queried with the same symbols for every node on a path.
         """
+        cache_key = tuple(relevant_symbols)
+        cached = self._possible_variants_cache.get(cache_key)
+        if cached is not None:
+            return cached
         if isinstance(self.dnf, Or):
             terms = self.dnf.args
         else:
@@ -200,6 +454,7 @@ class Condition:  # pylint: disable=too-few-public-methods
                 else:
                     attributes.append(Attribute(sym, None))
             possible_variants.append(Variant(attributes))
+        self._possible_variants_cache[cache_key] = possible_variants
         return possible_variants
 
 
@@ -232,6 +487,43 @@ class Part(Conditional):
 T = TypeVar("T", bound=Conditional)
 
 
+class _TreeContext(Generic[T]):  # pylint: disable=too-few-public-methods
+    """
+    Shared state for one variant tree build.
+
+    The context is created once per build and carries everything the
+    expansion loop needs: the flattened symbol order, the union of the
+    condition symbols, the finality bitmask of the root variant and the
+    cache of interned conditional lists. Nodes read from it instead of
+    recomputing these values per level.
+    """
+
+    def __init__(
+        self,
+        symbol_order: list[list[Symbol]],
+        possible_variants: list[Variant],
+        all_conditionals: list[T],
+        root_variant: Variant,
+    ):
+        self.symbol_order = symbol_order
+        self.num_levels = len(symbol_order)
+        self.flat_symbols = [sym for sublist in symbol_order for sym in sublist]
+        self.possible_variants = possible_variants
+        self.all_conditionals = all_conditionals
+        relevant: set[Symbol] = set()
+        for conditional in all_conditionals:
+            relevant.update(conditional.get_condition().symbols)
+        self.relevant_symbols = sorted(relevant, key=str)
+        self.conditionals_cache: dict[tuple[int, int], list[T]] = {}
+        flat_symbol_set = set(self.flat_symbols)
+        symbols_key = root_variant._get_masks()[0]  # pylint: disable=protected-access
+        final_mask = 0
+        for i, sym in enumerate(symbols_key):
+            if sym in flat_symbol_set:
+                final_mask |= 1 << i
+        self.final_mask = final_mask
+
+
 class VariantNode(Generic[T]):
     """
     A class to represent a node in a variant tree.
@@ -242,7 +534,7 @@ class VariantNode(Generic[T]):
     The leafs of the tree represent the possible variants.
     The conditionals are assigned to the leaf nodes.
 
-    The tree is created by recursively creating child nodes for each set of symbols
+    The tree is created by expanding child nodes breadth-first for each set of symbols
     in the symbol order. The child nodes are created by deriving possible variants
     from the parent variant, adding a new set of symbols with all possible values.
     Child nodes are created until all symbols are set in the current  node's variant.
@@ -337,23 +629,67 @@ class VariantNode(Generic[T]):
         :param symbol_order: The order of the symbols determines the order of levels in the tree
         :param all_conditionals: The conditional which are assigned to leaf nodes
         """
+        self._init_node(current_symbols, variant)
+        context = _TreeContext(
+            symbol_order, possible_variants, all_conditionals, variant
+        )
+        if variant.is_final(context.flat_symbols):
+            self._assign_conditionals(all_conditionals)
+        else:
+            self._expand(context)
+
+    def _init_node(self, current_symbols: list[Symbol], variant: Variant) -> None:
+        """Initialize the fields of a single node without expanding it"""
         self.node_props: dict[str, Any] = {}
         self.children: list[Self] = []
         self.parent = None
         self.current_symbols = current_symbols
         self.variant = variant
         self.conditionals = []
-        flat_symbols = [sym for sublist in symbol_order for sym in sublist]
-        if variant.is_final(flat_symbols):
-            for conditional in all_conditionals:
-                if conditional.get_condition().check(variant):
-                    self.conditionals.append(conditional)
-        else:
-            self._create_child_nodes(
-                symbol_order,
-                all_conditionals,
-                possible_variants,
-            )
+
+    @classmethod
+    def _create_node(cls, current_symbols: list[Symbol], variant: Variant) -> Self:
+        """Create a bare node that is expanded by the iterative builder"""
+        node = cls.__new__(cls)
+        node._init_node(current_symbols, variant)
+        return node
+
+    def _assign_conditionals(
+        self,
+        all_conditionals: list[T],
+        relevant_symbols: Optional[list[Symbol]] = None,
+        cache: Optional[dict[tuple[int, int], list[T]]] = None,
+    ) -> None:
+        """Assign the satisfied conditionals to a leaf node
+        When the builder passes a cache, leaves that agree on all
+        condition-relevant attribute values share one interned conditional
+        list, so the condition checks run once per distinct projection.
+        """
+        if cache is None:
+            self.conditionals = [
+                conditional
+                for conditional in all_conditionals
+                if conditional.get_condition().check(self.variant)
+            ]
+            return
+        variant_dict = self.variant.to_dict()
+        set_mask = 0
+        val_mask = 0
+        for i, sym in enumerate(relevant_symbols):
+            if sym in variant_dict:
+                set_mask |= 1 << i
+                if variant_dict[sym]:
+                    val_mask |= 1 << i
+        key = (set_mask, val_mask)
+        conditionals = cache.get(key)
+        if conditionals is None:
+            conditionals = [
+                conditional
+                for conditional in all_conditionals
+                if conditional.get_condition().check(self.variant)
+            ]
+            cache[key] = conditionals
+        self.conditionals = conditionals
 
     @staticmethod
     def create_root_variant(symbol_order: list[list[Symbol]]) -> Variant:
@@ -361,37 +697,44 @@ class VariantNode(Generic[T]):
         symbols_flat = [sym for sublist in symbol_order for sym in sublist]
         return Variant([Attribute(sym, None) for sym in symbols_flat])
 
-    def _create_child_nodes(
-        self,
-        symbol_order: list[list[Symbol]],
-        all_conditionals: list[T],
-        possible_variants: list[Variant],
-    ):
-        """Add nodes to a variant node"""
-        next_symbols = self._get_next_symbols(symbol_order)
-        if len(next_symbols) == 0:
-            return
-        bool_values = self._get_next_possible_values(next_symbols, possible_variants)
-        variants = self.variant.derive_variants(next_symbols, bool_values)
-        for variant in variants:
-            child = VariantNode(
-                next_symbols,
-                variant,
-                symbol_order,
-                possible_variants,
-                all_conditionals,
-            )
-            self._add_child(child)
-
-    def _get_next_symbols(self, symbol_order: list[list[Symbol]]) -> list[Symbol]:
-        """Return the next symbol in the symbol order"""
+    def _expand(self, context: _TreeContext[T]):
+        """Build the subtree below this node iteratively, breadth-first
+        Instead of recursing through the constructor for every child, a work
+        queue of nodes still to be expanded is processed in a single loop,
+        which avoids one Python frame per node.
+        All per-build constants live in the shared tree context; in
+        particular the finality test for a child collapses to comparing its
+        set-bit mask against the precomputed mask of the tree symbols instead
+        of rescanning the attribute list per child.
+        """
+        symbol_order = context.symbol_order
+        final_mask = context.final_mask
         if len(self.current_symbols) == 0:
-            return symbol_order[0]
-        try:
-            index = symbol_order.index(self.current_symbols)
-            return symbol_order[index + 1]
-        except IndexError:
-            return []
+            next_level = 0
+        else:
+            next_level = symbol_order.index(self.current_symbols) + 1
+        queue: deque[tuple[Self, int]] = deque([(self, next_level)])
+        while queue:
+            node, level = queue.popleft()
+            if level >= context.num_levels:
+                continue
+            next_symbols = symbol_order[level]
+            bool_values = node._get_next_possible_values(
+                next_symbols, context.possible_variants
+            )
+            variants = node.variant.derive_variants(next_symbols, bool_values)
+            for variant in variants:
+                child = VariantNode._create_node(next_symbols, variant)
+                node._add_child(child)
+                set_mask = variant._get_masks()[1]  # pylint: disable=protected-access
+                if set_mask & final_mask == final_mask:
+                    child._assign_conditionals(
+                        context.all_conditionals,
+                        context.relevant_symbols,
+                        context.conditionals_cache,
+                    )
+                else:
+                    queue.append((child, level + 1))
 
     def _get_next_possible_values(
         self, next_symbols: list[Symbol], possible_variants: list[Variant]
@@ -580,17 +923,23 @@ def print_tree(node, marker_str="+- ", level_markers=None, str_func=str):
 
     empty_str = " " * len(marker_str)
     connection_str = "|" + empty_str[:-1]
-
-    level = len(level_markers)
-    markers = "".join(
-        map(lambda draw: connection_str if draw else empty_str, level_markers[:-1])
-    )
-    markers += marker_str if level > 0 else ""
-    print(f"{markers}{str_func(node)}")
-
-    for i, child in enumerate(node.children):
-        is_last = i == len(node.children) - 1
-        print_tree(child, marker_str, [*level_markers, not is_last], str_func=str_func)
+    # index by the marker bool instead of mapping a lambda per level
+    marker_strs = (empty_str, connection_str)
+
+    out: list[str] = []
+
+    def _walk(node, level_markers):
+        level = len(level_markers)
+        markers = "".join(marker_strs[draw] for draw in level_markers[:-1])
+        markers += marker_str if level > 0 else ""
+        out.append(f"{markers}{str_func(node)}\n")
+        last_index = len(node.children) - 1
+        for i, child in enumerate(node.children):
+            _walk(child, [*level_markers, i != last_index])
+
+    _walk(node, level_markers)
+    # one buffered write instead of one print call per node
+    sys.stdout.write("".join(out))
 
 
 def collect_child_conditionals(node: VariantNode) -> set[Conditional]:
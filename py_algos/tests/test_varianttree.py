@@ -11,6 +11,7 @@ from py_algos_eseidinger.complexity.varianttree import (
     Condition,
     Part,
     VariantNode,
+    filter_possible_variants,
 )
 
 
@@ -38,6 +39,30 @@ def test_minterms():
     assert minterms == [3, 5, 7]
 
 
+def test_filter_possible_variants():
+    """Test the batched possibility check against the per-variant method.
+    This test checks if the batched kernel agrees with Variant.is_possible.
+    """
+    A, B, C = symbols("A, B, C")  # pylint: disable=invalid-name
+    possible_variants = [
+        Variant([Attribute(A, True), Attribute(B, True), Attribute(C, False)]),
+        Variant([Attribute(A, True), Attribute(B, True), Attribute(C, True)]),
+    ]
+    variants = [
+        Variant([Attribute(A, True), Attribute(B, True), Attribute(C, None)]),
+        Variant([Attribute(A, True), Attribute(B, False), Attribute(C, None)]),
+        Variant([Attribute(A, None), Attribute(B, None), Attribute(C, None)]),
+    ]
+    assert filter_possible_variants(variants, possible_variants) == [
+        True,
+        False,
+        True,
+    ]
+    assert filter_possible_variants(variants, possible_variants) == [
+        variant.is_possible(possible_variants) for variant in variants
+    ]
+
+
 class TestAttribute:
     """Test the functionality of the Attribute class.
     This class contains tests for the Attribute class and its methods.
@@ -214,6 +239,26 @@ class TestCondition:
         variant = Variant(attributes)
         assert not condition.check(variant)
 
+    def test_get_relevant_symbols(self):
+        """Test the get_relevant_symbols method of the Condition class.
+        This method returns the symbols that are true in at least one minterm.
+        """
+        A, B, C = symbols("A, B, C")
+        condition = Condition(B & (A | C))
+        assert condition.get_relevant_symbols() == [A, B, C]
+        condition = Condition(A & ~B)
+        assert condition.get_relevant_symbols() == [A]
+
+    def test_get_necessary_symbols(self):
+        """Test the get_necessary_symbols method of the Condition class.
+        This method returns the symbols that are true in every minterm.
+        """
+        A, B, C = symbols("A, B, C")
+        condition = Condition(B & (A | C))
+        assert condition.get_necessary_symbols() == [B]
+        condition = Condition(A | B)
+        assert condition.get_necessary_symbols() == []
+
     def test_to_possible_variants(self):
         """Test the to_possible_variants method of the Condition class.
         This method checks if the condition can be converted to possible variants.
@@ -3,6 +3,13 @@ from typing import Dict
 import doctest
 import math
 
+try:
+    # GMP-backed integers make the O(limbs) additions for huge n much faster
+    from gmpy2 import mpz
+except ImportError:
+    # gmpy2 is optional; plain Python ints work everywhere
+    mpz = int
+
 
 def fib1(n: int) -> int:
     """
@@ -186,11 +193,11 @@ def fib4(n: int) -> int:
         return n
     if n == 0: return n
     n = int(n)
-    last: int = 0
-    next: int = 1
+    last = mpz(0)
+    next = mpz(1)
     for _ in range(1, n):
         last, next = next, last + next
-    return next
+    return int(next)
 
 
 if __name__ == "__main__":
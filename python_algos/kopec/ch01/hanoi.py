@@ -29,14 +29,20 @@ def print_towers():
 
 
 def hanoi(begin: Stack[int], end: Stack[int], temp: Stack[int], n: int) -> None:
-    if n == 1:
-        end.push(begin.pop())
-    else:
-        hanoi(begin, temp, end, n - 1)
-        print_towers()
-        hanoi(begin, end, temp, 1)
-        print_towers()
-        hanoi(temp, end, begin, n - 1)
+    # Iterative solution: in move i the disc given by the number of trailing
+    # zeros of i moves, and its destination is forced.  The smallest disc
+    # cycles through the pegs in a direction that depends on the parity of n.
+    pegs: list[Stack[int]] = [begin, temp, end]
+    position: list[int] = [0] * n
+    for i in range(1, 1 << n):
+        disc = (i & -i).bit_length() - 1
+        src = position[disc]
+        if disc == 0:
+            dst = (src + (1 if n % 2 == 0 else 2)) % 3
+        else:
+            dst = 3 - src - position[0]
+        pegs[dst].push(pegs[src].pop())
+        position[disc] = dst
         print_towers()
 
 if __name__ == "__main__":
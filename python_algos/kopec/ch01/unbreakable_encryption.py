@@ -1,20 +1,29 @@
 from secrets import token_bytes
 
-def random_key(length: int) -> int:
-    tb: bytes = token_bytes(length)
-    return int.from_bytes(tb, "big")
+# XOR whole chunks through int.from_bytes/to_bytes (C speed) instead of
+# one Python-level XOR per byte; chunking keeps the buffers cache-sized.
+CHUNK_SIZE: int = 65536
 
-def encrypt(original: str) -> tuple[int, int]:
+def random_key(length: int) -> bytes:
+    return token_bytes(length)
+
+def xor_bytes(data1: bytes, data2: bytes) -> bytes:
+    result: bytearray = bytearray(len(data1))
+    for start in range(0, len(data1), CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, len(data1))
+        chunk = int.from_bytes(data1[start:end], "big") ^ int.from_bytes(data2[start:end], "big")
+        result[start:end] = chunk.to_bytes(end - start, "big")
+    return bytes(result)
+
+def encrypt(original: str) -> tuple[bytes, bytes]:
     original_bytes: bytes = original.encode()
-    dummy: int = random_key(len(original_bytes))
-    original_key: int = int.from_bytes(original_bytes, "big")
-    encrypted: int = original_key ^ dummy
+    dummy: bytes = random_key(len(original_bytes))
+    encrypted: bytes = xor_bytes(dummy, original_bytes)
     return dummy, encrypted
 
-def decrypt(key1: int, key2: int) -> str:
-    decrypted: int = key1 ^ key2
-    temp: bytes = decrypted.to_bytes((decrypted.bit_length() + 7) // 8, "big")
-    return temp.decode()
+def decrypt(key1: bytes, key2: bytes) -> str:
+    decrypted: bytes = xor_bytes(key1, key2)
+    return decrypted.decode()
 
 if __name__ == "__main__":
     key1, key2 = encrypt("One Time Pad!")
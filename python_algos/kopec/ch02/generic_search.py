@@ -1,10 +1,18 @@
-from typing import TypeVar, Iterable, Protocol, Sequence, Generic, Optional, Callable, Deque
+from typing import TypeVar, Iterable, Iterator, Protocol, Sequence, Generic, Optional, Callable
+from collections import deque
+from contextlib import contextmanager
 from heapq import heappush, heappop
+import gc
+
+import numpy as np
 
 T = TypeVar('T')
 
 
 def linear_contains(iterable: Iterable[T], key: T) -> bool:
+    if isinstance(iterable, np.ndarray):
+        # one vectorized compare instead of a Python-level loop
+        return bool((iterable == key).any())
     for item in iterable:
         if item == key:
             return True
@@ -32,6 +40,10 @@ class Comparable(Protocol):
 
 
 def binary_contains(sequence: Sequence[C], key: C) -> bool:
+    if isinstance(sequence, np.ndarray):
+        # searchsorted does the bisection in C on the sorted array
+        index: int = int(np.searchsorted(sequence, key))
+        return index < len(sequence) and sequence[index] == key
     low: int = 0
     high: int = len(sequence) - 1
     while low <= high:
@@ -45,25 +57,25 @@ def binary_contains(sequence: Sequence[C], key: C) -> bool:
     return False
 
 
-class Stack(Generic[T]):
-    def __init__(self) -> None:
-        self._container: list[T] = []
-
-    @property
-    def empty(self) -> bool:
-        return not self._container
-    
-    def content_copy(self) -> list[T]:
-        return self._container.copy()
-
-    def push(self, item: T) -> None:
-        self._container.append(item)
+# list.append/list.pop and deque.append/deque.popleft run in C; the old
+# Stack and Queue wrappers added one Python frame per frontier operation
+Stack = list
+Queue = deque
 
-    def pop(self) -> T:
-        return self._container.pop()
 
-    def __repr__(self) -> str:
-        return repr(self._container)
+@contextmanager
+def gc_paused():
+    # searches allocate many Node objects that stay alive until the search
+    # ends, so the generational collector repeatedly sweeps them for
+    # nothing; pause it for the duration and collect once afterwards
+    was_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+            gc.collect()
 
 
 class Node(Generic[T]):
@@ -73,36 +85,38 @@ class Node(Generic[T]):
         self.parent: Optional[Node] = parent
         self.cost: float = cost
         self.heuristic: float = heuristic
+        # cost and heuristic never change after construction, so the
+        # f-value is computed once instead of on every heap comparison
+        self._f: float = cost + heuristic
 
     def __lt__(self, other: "Node") -> bool:
-        return (self.cost + self.heuristic) < (other.cost + other.heuristic)
+        return self._f < other._f
 
 
 def dfs(initial: T, goal_test: Callable[[T], bool],
         successors: Callable[[T], list[T]]) -> Optional[Node[T]]:
-    frontier: Stack[Node[T]] = Stack()
-    frontier.push(Node(initial, None))
+    frontier: list[Node[T]] = [Node(initial, None)]
     explored: set[T] = {initial}
 
-    while not frontier.empty:
-        current_node: Node[T] = frontier.pop()
-        current_state: T = current_node.state
-        if goal_test(current_state):
-            return current_node
-        for child in successors(current_state):
-            if child in explored:
-                continue
-            explored.add(child)
-            frontier.push(Node(child, current_node))
+    with gc_paused():
+        while frontier:
+            current_node: Node[T] = frontier.pop()
+            current_state: T = current_node.state
+            if goal_test(current_state):
+                return current_node
+            for child in successors(current_state):
+                if child in explored:
+                    continue
+                explored.add(child)
+                frontier.append(Node(child, current_node))
     return None
 
 
 class DFS(Generic[T]):
     def __init__(self, initial: T, goal_test: Callable[[T], bool],
                  successors: Callable[[T], list[T]]) -> None:
-        self._frontier: Stack[Node[T]] = Stack()
         self._current_node: Optional[Node[T]] = Node(initial, None)
-        self._frontier.push(self._current_node)
+        self._frontier: list[Node[T]] = [self._current_node]
         self._explored: set[T] = {initial}
         self._goal_test: Callable[[T], bool] = goal_test
         self._successors: Callable[[T], list[T]] = successors
@@ -111,21 +125,25 @@ class DFS(Generic[T]):
     @property
     def currentNode(self) -> Optional[Node[T]]:
         return self._current_node
-    
+
     @property
     def solution(self) -> Optional[Node[T]]:
         return self._solution
-    
+
     @property
-    def frontier(self) -> Stack[Node[T]]:
+    def frontier(self) -> list[Node[T]]:
         return self._frontier
-    
+
     @property
     def explored(self) -> set[T]:
         return self._explored
 
+    def states(self) -> "Iterator[T]":
+        # frontier states without copying the frontier list
+        return (n.state for n in self._frontier)
+
     def step(self) -> bool:
-        if self._frontier.empty:
+        if not self._frontier:
             return True
         self._current_node: Node[T] = self._frontier.pop()
         current_state: T = self._current_node.state
@@ -136,7 +154,7 @@ class DFS(Generic[T]):
             if child in self._explored:
                 continue
             self._explored.add(child)
-            self._frontier.push(Node(child, self._current_node))
+            self._frontier.append(Node(child, self._current_node))
         return False
 
     def solve(self) -> Optional[Node[T]]:
@@ -154,43 +172,153 @@ def node_to_path(node: Node[T]) -> list[T]:
     return path
 
 
-class Queue(Generic[T]):
-    def __init__(self) -> None:
-        self._container: Deque[T] = Deque()
+def bfs(initial: T, goal_test: Callable[[T], bool],
+        successors: Callable[[T], list[T]]) -> Optional[Node[T]]:
+    frontier: deque[Node[T]] = deque()
+    frontier.append(Node(initial, None))
+    explored: set[T] = {initial}
 
-    @property
-    def empty(self) -> bool:
-        return not self._container
+    with gc_paused():
+        while frontier:
+            current_node: Node[T] = frontier.popleft()
+            current_state: T = current_node.state
+            if goal_test(current_state):
+                return current_node
+            for child in successors(current_state):
+                if child in explored:
+                    continue
+                explored.add(child)
+                frontier.append(Node(child, current_node))
+    return None
 
-    def push(self, item: T) -> None:
-        self._container.append(item)
 
-    def pop(self) -> T:
-        return self._container.popleft()
+def bfs_parents(initial: T, goal_test: Callable[[T], bool],
+                successors: Callable[[T], list[T]]) -> tuple[Optional[T], dict[T, Optional[T]]]:
+    # Node-free variant of bfs: only raw states go through the frontier and
+    # the search tree is kept as a parent dictionary, so no per-expansion
+    # object allocation. Returns the goal state (or None) and the parents.
+    frontier: deque[T] = deque()
+    frontier.append(initial)
+    parents: dict[T, Optional[T]] = {initial: None}
 
-    def __repr__(self) -> str:
-        return repr(self._container)
+    while frontier:
+        current_state: T = frontier.popleft()
+        if goal_test(current_state):
+            return current_state, parents
+        for child in successors(current_state):
+            if child in parents:
+                continue
+            parents[child] = current_state
+            frontier.append(child)
+    return None, parents
 
 
-def bfs(initial: T, goal_test: Callable[[T], bool],
-        successors: Callable[[T], list[T]]) -> Optional[Node[T]]:
-    frontier: Queue[Node[T]] = Queue()
-    frontier.push(Node(initial, None))
-    explored: set[T] = {initial}
+def parents_to_path(goal: T, parents: dict[T, Optional[T]]) -> list[T]:
+    path: list[T] = [goal]
+    while parents[path[-1]] is not None:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
 
-    while not frontier.empty:
-        current_node: Node[T] = frontier.pop()
-        current_state: T = current_node.state
-        if goal_test(current_state):
-            return current_node
+
+def _expand_bfs_level(frontier: "deque[T]", parents: dict[T, Optional[T]],
+                      other_parents: dict[T, Optional[T]],
+                      successors: Callable[[T], list[T]]) -> tuple[Optional[T], "deque[T]"]:
+    # expand one whole BFS level; report a state also reached from the
+    # other direction as the meeting point
+    next_frontier: deque[T] = deque()
+    while frontier:
+        current_state: T = frontier.popleft()
         for child in successors(current_state):
-            if child in explored:
+            if child in parents:
                 continue
-            explored.add(child)
-            frontier.push(Node(child, current_node))
+            parents[child] = current_state
+            if child in other_parents:
+                return child, next_frontier
+            next_frontier.append(child)
+    return None, next_frontier
+
+
+def bidirectional_bfs(initial: T, goal: T,
+                      successors: Callable[[T], list[T]]) -> Optional[list[T]]:
+    # two breadth-first searches meeting in the middle: each side only has
+    # to cover half the path depth, so far fewer states are expanded than
+    # with a single forward search
+    if initial == goal:
+        return [initial]
+    forward_parents: dict[T, Optional[T]] = {initial: None}
+    backward_parents: dict[T, Optional[T]] = {goal: None}
+    forward_frontier: deque[T] = deque([initial])
+    backward_frontier: deque[T] = deque([goal])
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            meeting, forward_frontier = _expand_bfs_level(
+                forward_frontier, forward_parents, backward_parents, successors)
+        else:
+            meeting, backward_frontier = _expand_bfs_level(
+                backward_frontier, backward_parents, forward_parents, successors)
+        if meeting is not None:
+            forward_path: list[T] = parents_to_path(meeting, forward_parents)
+            backward_path: list[T] = parents_to_path(meeting, backward_parents)
+            backward_path.reverse()
+            return forward_path + backward_path[1:]
     return None
 
 
+def bidirectional_astar(initial: T, goal: T,
+                        successors: Callable[[T], list[T]],
+                        forward_heuristic: Callable[[T], float],
+                        backward_heuristic: Callable[[T], float]) -> Optional[list[T]]:
+    # A* from both ends with the standard termination bound: stop once the
+    # smallest f-values of both frontiers can no longer beat the best
+    # meeting cost found so far
+    forward_frontier: list[Node[T]] = [
+        Node(initial, None, 0.0, forward_heuristic(initial))]
+    backward_frontier: list[Node[T]] = [
+        Node(goal, None, 0.0, backward_heuristic(goal))]
+    forward_cost: dict[T, float] = {initial: 0.0}
+    backward_cost: dict[T, float] = {goal: 0.0}
+    forward_nodes: dict[T, Node[T]] = {initial: forward_frontier[0]}
+    backward_nodes: dict[T, Node[T]] = {goal: backward_frontier[0]}
+    best_cost: float = float("inf")
+    meeting: Optional[T] = None
+
+    while forward_frontier and backward_frontier:
+        top_forward: Node[T] = forward_frontier[0]
+        top_backward: Node[T] = backward_frontier[0]
+        if top_forward._f + top_backward._f >= best_cost:
+            break
+        if top_forward._f <= top_backward._f:
+            frontier, costs, nodes = forward_frontier, forward_cost, forward_nodes
+            other_costs, heuristic = backward_cost, forward_heuristic
+        else:
+            frontier, costs, nodes = backward_frontier, backward_cost, backward_nodes
+            other_costs, heuristic = forward_cost, backward_heuristic
+        current_node: Node[T] = heappop(frontier)
+        current_state: T = current_node.state
+        if current_node.cost > costs[current_state]:
+            continue  # stale entry
+        for child in successors(current_state):
+            new_cost: float = current_node.cost + 1
+            if child not in costs or costs[child] > new_cost:
+                costs[child] = new_cost
+                child_node: Node[T] = Node(
+                    child, current_node, new_cost, heuristic(child))
+                nodes[child] = child_node
+                heappush(frontier, child_node)
+                if child in other_costs and new_cost + other_costs[child] < best_cost:
+                    best_cost = new_cost + other_costs[child]
+                    meeting = child
+
+    if meeting is None:
+        return None
+    forward_path: list[T] = node_to_path(forward_nodes[meeting])
+    backward_path: list[T] = node_to_path(backward_nodes[meeting])
+    backward_path.reverse()
+    return forward_path + backward_path[1:]
+
+
 class PriorityQueue(Generic[T]):
     def __init__(self) -> None:
         self._container: list[T] = []
@@ -209,22 +337,181 @@ class PriorityQueue(Generic[T]):
         return repr(self._container)
 
 
+class DaryHeap(Generic[T]):
+    # Array-backed 4-ary heap. The wider fan-out halves the tree height
+    # compared to a binary heap, and entries are (key, counter, item)
+    # tuples with a float key computed at push time, so comparisons never
+    # dispatch to Python-level __lt__ of the items. pop uses the
+    # cascade-down variant: the vacancy at the root is walked down to a
+    # leaf with one compare-and-copy per level, then the last element is
+    # sifted up from there.
+    D = 4
+
+    def __init__(self) -> None:
+        self._container: list[tuple[float, int, T]] = []
+        self._counter: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not self._container
+
+    def push(self, key: float, item: T) -> None:
+        heap = self._container
+        entry = (key, self._counter, item)
+        self._counter += 1
+        pos = len(heap)
+        heap.append(entry)
+        while pos > 0:
+            up = (pos - 1) // self.D
+            if heap[up][0] <= key:
+                break
+            heap[pos] = heap[up]
+            pos = up
+        heap[pos] = entry
+
+    def pop(self) -> T:
+        heap = self._container
+        result: T = heap[0][2]
+        last = heap.pop()
+        size = len(heap)
+        if size == 0:
+            return result
+        pos = 0
+        child = 1
+        while child < size:
+            end = min(child + self.D, size)
+            best = child
+            for index in range(child + 1, end):
+                if heap[index][0] < heap[best][0]:
+                    best = index
+            heap[pos] = heap[best]
+            pos = best
+            child = self.D * pos + 1
+        key = last[0]
+        while pos > 0:
+            up = (pos - 1) // self.D
+            if heap[up][0] <= key:
+                break
+            heap[pos] = heap[up]
+            pos = up
+        heap[pos] = last
+        return result
+
+    def __repr__(self) -> str:
+        return repr(self._container)
+
+
+class IndexedDaryHeap:
+    # 4-ary min-heap over the integer items 0..n-1 with decrease-key.
+    # Each item occupies at most one heap slot, tracked through a
+    # positions array, so algorithms like Dijkstra and eager Prim keep the
+    # heap at O(V) entries instead of pushing a duplicate per improvement.
+    D = 4
+    NOT_IN_HEAP = -1
+
+    def __init__(self, n: int) -> None:
+        self._heap: list[int] = []
+        self._keys: list[float] = [0.0] * n
+        self._positions: list[int] = [self.NOT_IN_HEAP] * n
+
+    @property
+    def empty(self) -> bool:
+        return not self._heap
+
+    def contains(self, item: int) -> bool:
+        return self._positions[item] != self.NOT_IN_HEAP
+
+    def key_of(self, item: int) -> float:
+        return self._keys[item]
+
+    def push(self, item: int, key: float) -> None:
+        self._keys[item] = key
+        self._positions[item] = len(self._heap)
+        self._heap.append(item)
+        self._sift_up(self._positions[item])
+
+    def decrease_key(self, item: int, key: float) -> None:
+        self._keys[item] = key
+        self._sift_up(self._positions[item])
+
+    def push_or_decrease_key(self, item: int, key: float) -> None:
+        if self._positions[item] == self.NOT_IN_HEAP:
+            self.push(item, key)
+        else:
+            self.decrease_key(item, key)
+
+    def pop(self) -> int:
+        heap = self._heap
+        result: int = heap[0]
+        self._positions[result] = self.NOT_IN_HEAP
+        last: int = heap.pop()
+        if heap:
+            heap[0] = last
+            self._positions[last] = 0
+            self._sift_down(0)
+        return result
+
+    def _sift_up(self, pos: int) -> None:
+        heap = self._heap
+        keys = self._keys
+        positions = self._positions
+        item = heap[pos]
+        key = keys[item]
+        while pos > 0:
+            up = (pos - 1) // self.D
+            parent = heap[up]
+            if keys[parent] <= key:
+                break
+            heap[pos] = parent
+            positions[parent] = pos
+            pos = up
+        heap[pos] = item
+        positions[item] = pos
+
+    def _sift_down(self, pos: int) -> None:
+        heap = self._heap
+        keys = self._keys
+        positions = self._positions
+        size = len(heap)
+        item = heap[pos]
+        key = keys[item]
+        while True:
+            child = self.D * pos + 1
+            if child >= size:
+                break
+            end = min(child + self.D, size)
+            best = child
+            for index in range(child + 1, end):
+                if keys[heap[index]] < keys[heap[best]]:
+                    best = index
+            if keys[heap[best]] >= key:
+                break
+            heap[pos] = heap[best]
+            positions[heap[best]] = pos
+            pos = best
+        heap[pos] = item
+        positions[item] = pos
+
+
 def astar(initial: T, goal_test: Callable[[T], bool],
           successors: Callable[[T], list[T]],
           heuristic: Callable[[T], float]) -> Optional[Node[T]]:
-    frontier: PriorityQueue[Node[T]] = PriorityQueue()
-    frontier.push(Node(initial, None, 0.0, heuristic(initial)))
+    frontier: DaryHeap[Node[T]] = DaryHeap()
+    initial_heuristic: float = heuristic(initial)
+    frontier.push(initial_heuristic, Node(initial, None, 0.0, initial_heuristic))
     explored: dict[T, float] = {initial: 0.0}
 
-    while not frontier.empty:
-        current_node: Node[T] = frontier.pop()
-        current_state: T = current_node.state
-        if goal_test(current_state):
-            return current_node
-        for child in successors(current_state):
-            new_cost: float = current_node.cost + 1
-            if child not in explored or explored[child] > new_cost:
-                explored[child] = new_cost
-                frontier.push(Node(child, current_node,
-                              new_cost, heuristic(child)))
+    with gc_paused():
+        while not frontier.empty:
+            current_node: Node[T] = frontier.pop()
+            current_state: T = current_node.state
+            if goal_test(current_state):
+                return current_node
+            for child in successors(current_state):
+                new_cost: float = current_node.cost + 1
+                if child not in explored or explored[child] > new_cost:
+                    explored[child] = new_cost
+                    child_heuristic: float = heuristic(child)
+                    frontier.push(new_cost + child_heuristic,
+                                  Node(child, current_node, new_cost, child_heuristic))
     return None
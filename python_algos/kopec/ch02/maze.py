@@ -1,19 +1,21 @@
 from typing import NamedTuple, Optional, Callable
-from enum import Enum
-import random
 from math import sqrt
 
-from kopec.ch02.generic_search import Node, dfs, node_to_path, bfs, astar, DFS
+import numpy as np
 
+from kopec.ch02.generic_search import (
+    Node, dfs, node_to_path, bfs_parents, parents_to_path, astar,
+    bidirectional_astar, DFS)
+from kopec.ch02.maze_astar import astar_parents
 
-class Cell(str, Enum):
-    EMPTY = " "
-    BLOCKED = "X"
-    START = "S"
-    GOAL = "G"
-    PATH = "*"
-    FRONTIER = "O"
-    EXPLORED = "."
+
+# cell states as uint8 so the grid packs into one contiguous array
+EMPTY, BLOCKED, START, GOAL, PATH, FRONTIER, EXPLORED = (
+    np.uint8(i) for i in range(7))
+CELL_CHARS: np.ndarray = np.array(
+    [" ", "X", "S", "G", "*", "O", "."], dtype="<U1")
+# successor offsets in bit order of the per-cell neighbor masks
+NEIGHBOR_OFFSETS: tuple[tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
 
 
 class MazeLocation(NamedTuple):
@@ -28,62 +30,109 @@ class Maze:
         self._columns: int = columns
         self.start: MazeLocation = start
         self.goal: MazeLocation = goal
-        self._grid: list[list[Cell]] = [
-            [Cell.EMPTY for c in range(columns)] for r in range(rows)]
+        self._grid: np.ndarray = np.full((rows, columns), EMPTY, dtype=np.uint8)
         self._randomly_fill(rows, columns, sparseness)
-        self._grid[start.row][start.column] = Cell.START
-        self._grid[goal.row][goal.column] = Cell.GOAL
+        self._grid[start.row, start.column] = START
+        self._grid[goal.row, goal.column] = GOAL
+        self._neighbor_mask: np.ndarray = self._build_neighbor_mask()
+        # flat-index counterparts of start/goal and NEIGHBOR_OFFSETS for
+        # searches that carry states as plain ints
+        self.start_index: int = self.encode(start)
+        self.goal_index: int = self.encode(goal)
+        self._flat_offsets: tuple[int, ...] = (columns, -columns, 1, -1)
 
     def _randomly_fill(self, rows: int, columns: int, sparseness: float):
-        for row in range(rows):
-            for column in range(columns):
-                if random.uniform(0, 1.0) < sparseness:
-                    self._grid[row][column] = Cell.BLOCKED
+        # one C-level RNG call for the whole grid instead of one
+        # random.uniform round-trip per cell
+        self._grid[np.random.random((rows, columns)) < sparseness] = BLOCKED
 
     def __str__(self) -> str:
-        output: str = ""
-        for row in self._grid:
-            output += "".join([c.value for c in row]) + "\n"
-        return output
+        return "\n".join("".join(row) for row in CELL_CHARS[self._grid]) + "\n"
 
     def goal_test(self, ml: MazeLocation) -> bool:
         return ml == self.goal
 
+    # searches can carry locations as row * columns + column ints: int
+    # hashing is identity and set/dict lookups skip the tuple-hash combine
+    # and the namedtuple allocation per expanded state
+    def encode(self, ml: MazeLocation) -> int:
+        return ml.row * self._columns + ml.column
+
+    def decode(self, index: int) -> MazeLocation:
+        return MazeLocation(index // self._columns, index % self._columns)
+
+    def index_goal_test(self, index: int) -> bool:
+        return index == self.goal_index
+
+    def index_successors(self, index: int) -> list[int]:
+        successors: list[int] = []
+        mask: int = int(self._neighbor_mask.flat[index])
+        while mask:
+            direction: int = (mask & -mask).bit_length() - 1
+            successors.append(index + self._flat_offsets[direction])
+            mask &= mask - 1
+        return successors
+
+    def _build_neighbor_mask(self) -> np.ndarray:
+        # bit d of a cell is set when the neighbor at NEIGHBOR_OFFSETS[d]
+        # is in bounds and not blocked; blocked cells never change after
+        # construction, so the masks are computed once for the whole grid
+        passable: np.ndarray = (self._grid != BLOCKED).astype(np.uint8)
+        mask: np.ndarray = np.zeros(self._grid.shape, np.uint8)
+        mask[:-1, :] |= passable[1:, :] << 0
+        mask[1:, :] |= passable[:-1, :] << 1
+        mask[:, :-1] |= passable[:, 1:] << 2
+        mask[:, 1:] |= passable[:, :-1] << 3
+        return mask
+
     def successors(self, ml: MazeLocation) -> list[MazeLocation]:
         locations: list[MazeLocation] = []
-        if ml.row + 1 < self._rows and self._grid[ml.row + 1][ml.column] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row + 1, ml.column))
-        if ml.row - 1 >= 0 and self._grid[ml.row - 1][ml.column] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row - 1, ml.column))
-        if ml.column + 1 < self._columns and self._grid[ml.row][ml.column + 1] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row, ml.column + 1))
-        if ml.column - 1 >= 0 and self._grid[ml.row][ml.column - 1] != Cell.BLOCKED:
-            locations.append(MazeLocation(ml.row, ml.column - 1))
+        mask: int = int(self._neighbor_mask[ml.row, ml.column])
+        while mask:
+            direction: int = (mask & -mask).bit_length() - 1
+            offset = NEIGHBOR_OFFSETS[direction]
+            locations.append(MazeLocation(ml.row + offset[0], ml.column + offset[1]))
+            mask &= mask - 1
         return locations
 
+    def _mark_cells(self, locations: list[MazeLocation], cell: np.uint8):
+        if len(locations) > 0:
+            rows = [ml.row for ml in locations]
+            columns = [ml.column for ml in locations]
+            self._grid[rows, columns] = cell
+        self._grid[self.start.row, self.start.column] = START
+        self._grid[self.goal.row, self.goal.column] = GOAL
+
     def mark(self, path: list[MazeLocation]):
-        for maze_location in path:
-            self._grid[maze_location.row][maze_location.column] = Cell.PATH
-        self._grid[self.start.row][self.start.column] = Cell.START
-        self._grid[self.goal.row][self.goal.column] = Cell.GOAL
+        self._mark_cells(path, PATH)
 
     def mark_frontier(self, frontier: list[MazeLocation]):
-        for maze_location in frontier:
-            self._grid[maze_location.row][maze_location.column] = Cell.FRONTIER
-        self._grid[self.start.row][self.start.column] = Cell.START
-        self._grid[self.goal.row][self.goal.column] = Cell.GOAL
+        self._mark_cells(frontier, FRONTIER)
 
     def mark_explored(self, explored: list[MazeLocation]):
-        for maze_location in explored:
-            self._grid[maze_location.row][maze_location.column] = Cell.EXPLORED
-        self._grid[self.start.row][self.start.column] = Cell.START
-        self._grid[self.goal.row][self.goal.column] = Cell.GOAL
+        self._mark_cells(explored, EXPLORED)
 
     def clear(self, path: list[MazeLocation]):
-        for maze_location in path:
-            self._grid[maze_location.row][maze_location.column] = Cell.EMPTY
-        self._grid[self.start.row][self.start.column] = Cell.START
-        self._grid[self.goal.row][self.goal.column] = Cell.GOAL
+        self._mark_cells(path, EMPTY)
+
+    def solve_astar(self) -> Optional[list[MazeLocation]]:
+        # grid-specialized A* working on flat indices and a parent array
+        parent: np.ndarray = astar_parents(
+            self._grid, self.start.row, self.start.column,
+            self.goal.row, self.goal.column, BLOCKED)
+        start_index: int = self.start.row * self._columns + self.start.column
+        goal_index: int = self.goal.row * self._columns + self.goal.column
+        if parent[goal_index] < 0 and goal_index != start_index:
+            return None
+        path: list[MazeLocation] = []
+        index: int = goal_index
+        while True:
+            path.append(MazeLocation(index // self._columns, index % self._columns))
+            if index == start_index:
+                break
+            index = int(parent[index])
+        path.reverse()
+        return path
 
     def euclidean_distance(self, ml: MazeLocation) -> float:
         xdist: int = ml.column - self.goal.column
@@ -97,18 +146,33 @@ class Maze:
 
 
 def euclidean_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
+    # capture the goal coordinates as locals so the per-call work is two
+    # subtractions instead of attribute loads on the goal tuple
+    goal_row: int = goal.row
+    goal_column: int = goal.column
+
     def distance(ml: MazeLocation) -> float:
-        xdist: int = ml.column - goal.column
-        ydist: int = ml.row - goal.row
+        xdist: int = ml.column - goal_column
+        ydist: int = ml.row - goal_row
         return sqrt((xdist * xdist) + (ydist * ydist))
     return distance
 
 
 def manhattan_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
+    goal_row: int = goal.row
+    goal_column: int = goal.column
+
     def distance(ml: MazeLocation) -> float:
-        xdist: int = abs(ml.column - goal.column)
-        ydist: int = abs(ml.row - goal.row)
-        return (xdist + ydist)
+        return abs(ml.column - goal_column) + abs(ml.row - goal_row)
+    return distance
+
+
+def manhattan_distance_index(goal_index: int, columns: int) -> Callable[[int], float]:
+    goal_row, goal_column = divmod(goal_index, columns)
+
+    def distance(index: int) -> float:
+        row, column = divmod(index, columns)
+        return abs(column - goal_column) + abs(row - goal_row)
     return distance
 
 
@@ -119,7 +183,7 @@ def main_step_by_step() -> None:
     while not dfs.step():
         current_solution: Optional[Node[MazeLocation]] = dfs.currentNode
         current_path = node_to_path(current_solution)
-        current_frontier = [ n.state for n in dfs.frontier.content_copy() ]
+        current_frontier = list(dfs.states())
         m.mark_explored(dfs.explored)
         m.mark_frontier(current_frontier)
         m.mark(current_path)
@@ -133,7 +197,7 @@ def main_step_by_step() -> None:
     else:
         solution: Optional[Node[MazeLocation]] = dfs.solution
         path = node_to_path(solution)
-        current_frontier = [ n.state for n in dfs.frontier.content_copy() ]
+        current_frontier = list(dfs.states())
         m.mark_explored(dfs.explored)
         m.mark_frontier(current_frontier)
         m.mark(path)
@@ -147,38 +211,52 @@ def main_step_by_step() -> None:
 def main() -> None:
     m: Maze = Maze(sparseness=0.2)
     print(m)
-    solution1: Optional[Node[MazeLocation]] = dfs(
-        m.start, m.goal_test, m.successors)
+    # the generic searches run on encoded int states; paths are decoded
+    # back to MazeLocations once at the end for marking
+    solution1: Optional[Node[int]] = dfs(
+        m.start_index, m.index_goal_test, m.index_successors)
     if solution1 is None:
         print("No solution found with depth-first search!")
     else:
-        path1: list[MazeLocation] = node_to_path(solution1)
+        path1: list[MazeLocation] = [m.decode(i) for i in node_to_path(solution1)]
         m.mark(path1)
         print(m)
         m.clear(path1)
         print(m)
 
-    solution2: Optional[Node[MazeLocation]] = bfs(
-        m.start, m.goal_test, m.successors)
-    if solution2 is None:
+    goal2, parents2 = bfs_parents(m.start_index, m.index_goal_test, m.index_successors)
+    if goal2 is None:
         print("No solution found with breadth-first search!")
     else:
-        path2: list[MazeLocation] = node_to_path(solution2)
+        path2: list[MazeLocation] = [m.decode(i) for i in parents_to_path(goal2, parents2)]
         m.mark(path2)
         print(m)
         m.clear(path2)
         print(m)
 
-    distance: Callable[[MazeLocation], float] = manhattan_distance(m.goal)
-    solution3: Optional[Node[MazeLocation]] = astar(
-        m.start, m.goal_test, m.successors, distance)
+    distance: Callable[[int], float] = manhattan_distance_index(
+        m.goal_index, m._columns)
+    solution3: Optional[Node[int]] = astar(
+        m.start_index, m.index_goal_test, m.index_successors, distance)
     if solution3 is None:
         print("No solution found with A*!")
     else:
-        path3: list[MazeLocation] = node_to_path(solution3)
+        path3: list[MazeLocation] = [m.decode(i) for i in node_to_path(solution3)]
         m.mark(path3)
         print(m)
         m.clear(path3)
+        print(m)
+
+    path4: Optional[list[int]] = bidirectional_astar(
+        m.start_index, m.goal_index, m.index_successors,
+        distance, manhattan_distance_index(m.start_index, m._columns))
+    if path4 is None:
+        print("No solution found with bidirectional A*!")
+    else:
+        path4_locations: list[MazeLocation] = [m.decode(i) for i in path4]
+        m.mark(path4_locations)
+        print(m)
+        m.clear(path4_locations)
 
 
 if __name__ == "__main__":
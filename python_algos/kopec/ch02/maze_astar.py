@@ -0,0 +1,98 @@
+import numpy as np
+
+try:
+    # numba is optional; the kernel also runs as plain Python
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def astar_parents(grid: np.ndarray, start_row: int, start_column: int,
+                  goal_row: int, goal_column: int, blocked: int) -> np.ndarray:
+    # A* specialized to a uint8 grid with unit step costs and a manhattan
+    # heuristic. States are flat indices row * columns + column, the open
+    # set is an array-backed binary heap and the result is a parent-index
+    # array, so no Python objects are allocated per expansion.
+    rows, columns = grid.shape
+    n = rows * columns
+    parent = np.full(n, -1, np.int32)
+    g_score = np.full(n, np.inf, np.float32)
+    # each cell is pushed at most once per incoming edge
+    capacity = 4 * n + 1
+    heap_keys = np.empty(capacity, np.float32)
+    heap_nodes = np.empty(capacity, np.int32)
+    size = 0
+    start = start_row * columns + start_column
+    goal = goal_row * columns + goal_column
+    g_score[start] = 0.0
+    heap_keys[0] = abs(start_row - goal_row) + abs(start_column - goal_column)
+    heap_nodes[0] = start
+    size = 1
+    while size > 0:
+        node = heap_nodes[0]
+        key = heap_keys[0]
+        # pop: move the last element to the root and sift it down
+        size -= 1
+        last_key = heap_keys[size]
+        last_node = heap_nodes[size]
+        pos = 0
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap_keys[child + 1] < heap_keys[child]:
+                child += 1
+            if heap_keys[child] < last_key:
+                heap_keys[pos] = heap_keys[child]
+                heap_nodes[pos] = heap_nodes[child]
+                pos = child
+            else:
+                break
+        if size > 0:
+            heap_keys[pos] = last_key
+            heap_nodes[pos] = last_node
+        row = node // columns
+        column = node % columns
+        if key > g_score[node] + abs(row - goal_row) + abs(column - goal_column):
+            continue  # stale entry, a cheaper path was found after the push
+        if node == goal:
+            return parent
+        new_cost = g_score[node] + np.float32(1.0)
+        for direction in range(4):
+            if direction == 0:
+                neighbor_row, neighbor_column = row + 1, column
+            elif direction == 1:
+                neighbor_row, neighbor_column = row - 1, column
+            elif direction == 2:
+                neighbor_row, neighbor_column = row, column + 1
+            else:
+                neighbor_row, neighbor_column = row, column - 1
+            if neighbor_row < 0 or neighbor_row >= rows:
+                continue
+            if neighbor_column < 0 or neighbor_column >= columns:
+                continue
+            if grid[neighbor_row, neighbor_column] == blocked:
+                continue
+            neighbor = neighbor_row * columns + neighbor_column
+            if new_cost < g_score[neighbor]:
+                g_score[neighbor] = new_cost
+                parent[neighbor] = node
+                # push: append and sift up
+                key = new_cost + abs(neighbor_row - goal_row) + \
+                    abs(neighbor_column - goal_column)
+                pos = size
+                size += 1
+                while pos > 0:
+                    up = (pos - 1) // 2
+                    if heap_keys[up] <= key:
+                        break
+                    heap_keys[pos] = heap_keys[up]
+                    heap_nodes[pos] = heap_nodes[up]
+                    pos = up
+                heap_keys[pos] = key
+                heap_nodes[pos] = neighbor
+    return parent
+
+
+if njit is not None:
+    astar_parents = njit(cache=True)(astar_parents)
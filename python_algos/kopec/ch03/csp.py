@@ -17,37 +17,98 @@ class CSP(Generic[V, D]):
         self.variables: list[V] = variables
         self.domains: dict[V, list[D]] = domains
         self.constraints: dict[V, list[Constraint[V, D]]] = {}
+        self.neighbors: dict[V, set[V]] = {}
+        # per constraint the other variables it touches, so consistent can
+        # skip constraints that are not fully bound without calling them
+        self._constraint_others: dict[V, list[tuple[Constraint[V, D], list[V]]]] = {}
         for variable in self.variables:
             self.constraints[variable] = []
+            self.neighbors[variable] = set()
+            self._constraint_others[variable] = []
             if variable not in self.domains:
                 raise LookupError("Every variable should have a domain assigned to it.")
-            
+
     def add_constraint(self, constraint: Constraint[V, D]) -> None:
         for variable in constraint.variables:
             if variable not in self.variables:
                 raise LookupError("Variable in constraint not in CSP.")
             else:
                 self.constraints[variable].append(constraint)
+                others = [o for o in constraint.variables if o != variable]
+                self._constraint_others[variable].append((constraint, others))
+                self.neighbors[variable].update(others)
 
     def consistent(self, variable: V, assignment: dict[V, D]) -> bool:
-        for constraint in self.constraints[variable]:
-            if not constraint.satisfied(assignment):
-                return False
+        # satisfied is only called with all constraint variables bound, so
+        # implementations do not need a partial-assignment short circuit
+        for constraint, others in self._constraint_others[variable]:
+            for other in others:
+                if other not in assignment:
+                    break
+            else:
+                if not constraint.satisfied(assignment):
+                    return False
         return True
-    
-    def backtracking_search(self, assignment: dict[V, D] = {}) -> Optional[dict[V, D]]:
+
+    def _prune_neighbors(self, variable: V, assignment: dict[V, D],
+                         domains: dict[V, list[D]]
+                         ) -> Optional[list[tuple[V, list[D]]]]:
+        # forward checking: drop values that became inconsistent from the
+        # domains of unassigned neighbors. The replaced domains are
+        # returned so the caller can undo the pruning on backtrack; an
+        # emptied domain restores immediately and reports failure as None.
+        removed: list[tuple[V, list[D]]] = []
+        for neighbor in self.neighbors[variable]:
+            if neighbor in assignment:
+                continue
+            remaining: list[D] = []
+            for value in domains[neighbor]:
+                assignment[neighbor] = value
+                if self.consistent(neighbor, assignment):
+                    remaining.append(value)
+                del assignment[neighbor]
+            if len(remaining) < len(domains[neighbor]):
+                removed.append((neighbor, domains[neighbor]))
+                domains[neighbor] = remaining
+                if not remaining:
+                    self._restore_domains(removed, domains)
+                    return None
+        return removed
+
+    @staticmethod
+    def _restore_domains(removed: list[tuple[V, list[D]]],
+                         domains: dict[V, list[D]]) -> None:
+        for variable, domain in removed:
+            domains[variable] = domain
+
+    def backtracking_search(self, assignment: Optional[dict[V, D]] = None) -> Optional[dict[V, D]]:
+        # a fresh dict per call: the search mutates the assignment in
+        # place, so a shared mutable default would leak between solves
+        if assignment is None:
+            assignment = {}
+        return self._backtrack(
+            assignment, {v: list(d) for v, d in self.domains.items()})
+
+    def _backtrack(self, assignment: dict[V, D],
+                   domains: dict[V, list[D]]) -> Optional[dict[V, D]]:
         if len(assignment) == len(self.variables):
             return assignment
-        
+
         unassigned: list[V] = [v for v in self.variables if v not in assignment]
 
-        first: V = unassigned[0]
-        for value in self.domains[first]:
-            local_assignment = assignment.copy()
-            local_assignment[first] = value
-            if self.consistent(first, local_assignment):
-                result: Optional[dict[V, D]] = self.backtracking_search(local_assignment)
-                if result is not None:
-                    return result
+        # minimum remaining values: branch on the most constrained variable.
+        # The assignment and the domains are mutated in place and undone on
+        # backtrack, so no per-branch dict copies are made.
+        first: V = min(unassigned, key=lambda v: len(domains[v]))
+        for value in domains[first]:
+            assignment[first] = value
+            if self.consistent(first, assignment):
+                removed = self._prune_neighbors(first, assignment, domains)
+                if removed is not None:
+                    result: Optional[dict[V, D]] = self._backtrack(
+                        assignment, domains)
+                    if result is not None:
+                        return result
+                    self._restore_domains(removed, domains)
+            del assignment[first]
         return None
-    
\ No newline at end of file
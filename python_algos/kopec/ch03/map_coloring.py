@@ -8,9 +8,7 @@ class MapColoringConstraint(Constraint[str, str]):
         self.place2: str = place2
 
     def satisfied(self, assignment: dict[str, str]) -> bool:
-        if self.place1 not in assignment or self.place2 not in assignment:
-            return True
-        
+        # CSP.consistent only calls this once both places are assigned
         return assignment[self.place1] != assignment[self.place2]
     
 if __name__ == "__main__":
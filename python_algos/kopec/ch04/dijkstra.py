@@ -1,40 +1,58 @@
 from typing import TypeVar, Optional
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from kopec.ch04.mst import WeightedPath, print_weighted_path
 from kopec.ch04.weighted_graph import WeightedGraph
 from kopec.ch04.weighted_edge import WeightedEdge
-from kopec.ch02.generic_search import PriorityQueue
+from kopec.ch02.generic_search import IndexedDaryHeap, gc_paused
 
 V = TypeVar('V')
 
-@dataclass
-class DijkstraNode:
-    vertex: int
-    distance: float
-
-    def __lt__(self, other: "DijkstraNode") -> bool:
-        return self.distance < other.distance
-    
-    def __eq__(self, other: "DijkstraNode") -> bool:
-        return self.distance == other.distance
-    
-def dijkstra(wg: WeightedGraph[V], root: V) -> tuple[list[Optional[float]], dict[int, WeightedEdge]]:
+def dijkstra(wg: WeightedGraph[V], root: V) -> tuple[list[Optional[float]], list[Optional[WeightedEdge]]]:
+    # eager Dijkstra: the indexed heap holds each vertex at most once and
+    # a shorter path decreases its key in place, so the heap stays at
+    # O(V) entries and no stale pops have to be skipped; the shortest-path
+    # tree is a flat list indexed by vertex instead of a hashed dict
     first: int = wg.index_of(root)
     distances: list[Optional[float]] = [None] * wg.vertex_count
     distances[first] = 0
-    path_dict: dict[int, WeightedEdge] = {}
-    pq: PriorityQueue[DijkstraNode] = PriorityQueue()
-    pq.push(DijkstraNode(first, 0))
-    while not pq.empty:
-        u: int = pq.pop().vertex
-        dist_u: float = distances[u]
-        for we in wg.edges_for_index(u):
-            dist_v: float = distances[we.v]
-            if dist_v is None or dist_v > we.weight + dist_u:
-                distances[we.v] = we.weight + dist_u
-                path_dict[we.v] = we
-                pq.push(DijkstraNode(we.v, we.weight + dist_u))
-    return distances, path_dict
+    path_list: list[Optional[WeightedEdge]] = [None] * wg.vertex_count
+    pq: IndexedDaryHeap = IndexedDaryHeap(wg.vertex_count)
+    pq.push(first, 0)
+    with gc_paused():
+        while not pq.empty:
+            u: int = pq.pop()
+            dist_u: float = distances[u]
+            for we in wg.edges_for_index(u):
+                dist_v: float = distances[we.v]
+                if dist_v is None or dist_v > we.weight + dist_u:
+                    distances[we.v] = we.weight + dist_u
+                    path_list[we.v] = we
+                    pq.push_or_decrease_key(we.v, we.weight + dist_u)
+    return distances, path_list
+
+# the graph is shipped to each worker process once through the pool
+# initializer instead of being pickled again for every root
+_worker_graph: Optional[WeightedGraph] = None
+
+def _init_dijkstra_worker(wg: WeightedGraph) -> None:
+    global _worker_graph
+    _worker_graph = wg
+
+def _dijkstra_worker(root) -> tuple[list[Optional[float]], list[Optional[WeightedEdge]]]:
+    return dijkstra(_worker_graph, root)
+
+def dijkstra_many(wg: WeightedGraph[V], roots: list[V],
+                  max_workers: Optional[int] = None
+                  ) -> list[tuple[list[Optional[float]], list[Optional[WeightedEdge]]]]:
+    # each source is an independent search over read-only graph state, so
+    # the roots are farmed out to worker processes to sidestep the GIL;
+    # results come back in root order
+    if len(roots) <= 1:
+        return [dijkstra(wg, root) for root in roots]
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_dijkstra_worker,
+                             initargs=(wg,)) as executor:
+        return list(executor.map(_dijkstra_worker, roots))
 
 def distance_list_to_vertex_dict(wg: WeightedGraph[V], distances: list[Optional[float]]) -> dict[V, Optional[float]]:
     distance_dict: dict[V, Optional[float]] = {}
@@ -42,14 +60,14 @@ def distance_list_to_vertex_dict(wg: WeightedGraph[V], distances: list[Optional[
         distance_dict[wg.vertex_at(i)] = distances[i]
     return distance_dict
 
-def path_dict_to_path(start: int, end: int, path_dict: dict[int, WeightedEdge]) -> WeightedPath:
-    if len(path_dict) == 0:
+def path_dict_to_path(start: int, end: int, path_list: list[Optional[WeightedEdge]]) -> WeightedPath:
+    if path_list[end] is None:
         return []
     edge_path: WeightedPath = []
-    e: WeightedEdge = path_dict[end]
+    e: WeightedEdge = path_list[end]
     edge_path.append(e)
     while e.u != start:
-        e = path_dict[e.u]
+        e = path_list[e.u]
         edge_path.append(e)
     return list(reversed(edge_path))
 
@@ -6,6 +6,9 @@ V = TypeVar('V')
 class Graph(Generic[V]):
     def __init__(self, vertices: list[V] = []) -> None:
         self._vertices: list[V] = vertices
+        # index lookup table so index_of is O(1) instead of a list scan
+        self._vertex_to_index: dict[V, int] = {
+            vertex: index for index, vertex in enumerate(vertices)}
         self._edges: list[list[Edge]] = [[] for _ in vertices]
 
     @property
@@ -18,6 +21,7 @@ class Graph(Generic[V]):
     
     def add_vertex(self, vertex: V) -> int:
         self._vertices.append(vertex)
+        self._vertex_to_index[vertex] = self.vertex_count - 1
         self._edges.append([])
         return self.vertex_count - 1
     
@@ -30,15 +34,15 @@ class Graph(Generic[V]):
         self.add_edge(edge)
 
     def add_edge_by_vertices(self, first: V, second: V) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self._vertex_to_index[first]
+        v: int = self._vertex_to_index[second]
         self.add_edge_by_indices(u, v)
 
     def vertex_at(self, index: int) -> V:
         return self._vertices[index]
     
     def index_of(self, vertex: V) -> int:
-        return self._vertices.index(vertex)
+        return self._vertex_to_index[vertex]
     
     def neighbors_for_index(self, index: int) -> list[V]:
         return list(map(self.vertex_at, [e.v for e in self._edges[index]]))
@@ -1,6 +1,6 @@
 from typing import TypeVar, Optional
 from kopec.ch04.graph import Graph
-from kopec.ch02.generic_search import bfs, Node, node_to_path
+from kopec.ch02.generic_search import bfs_parents, parents_to_path, bidirectional_bfs
 
 V = TypeVar('V')
 
@@ -36,11 +36,19 @@ if __name__ == "__main__":
     city_graph.add_edge_by_vertices("Philadelphia", "Washington")
     print(city_graph)
 
+    goal, parents = bfs_parents(
+        "Boston", lambda x: x == "Miami", city_graph.neighbors_for_vertex)
+    if goal is None:
+        print("No solution with breadth-first-search found!")
+    else:
+        path: list[V] = parents_to_path(goal, parents)
+        print("Path from Boston to Miami:")
+        print(path)
 
-bfs_result: Optional[Node[V]] = bfs("Boston", lambda x: x == "Miami", city_graph.neighbors_for_vertex)
-if bfs_result is None:
-    print("No solution with breadth-first-search found!")
-else:
-    path: list[V] = node_to_path(bfs_result)
-    print("Path from Boston to Miami:")
-    print(path)
+    bidirectional_path = bidirectional_bfs(
+        "Boston", "Miami", city_graph.neighbors_for_vertex)
+    if bidirectional_path is None:
+        print("No solution with bidirectional breadth-first-search found!")
+    else:
+        print("Path from Boston to Miami (bidirectional):")
+        print(bidirectional_path)
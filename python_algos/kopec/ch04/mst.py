@@ -1,7 +1,7 @@
 from typing import TypeVar, Optional
 from kopec.ch04.weighted_graph import WeightedGraph
 from kopec.ch04.weighted_edge import WeightedEdge
-from kopec.ch02.generic_search import PriorityQueue
+from kopec.ch02.generic_search import IndexedDaryHeap
 
 V = TypeVar('V')
 
@@ -11,26 +11,31 @@ def total_weight(wp: WeightedPath) -> float:
     return sum([e.weight for e in wp])
 
 def mst(wg: WeightedGraph[V], start: int = 0) -> Optional[WeightedPath]:
+    # eager Prim: the heap is keyed by the cheapest edge connecting each
+    # unvisited vertex to the tree, so it holds at most V entries and
+    # every pop adds a tree edge instead of possibly being skipped
     if start > (wg.vertex_count - 1) or start < 0:
         return None
     result: WeightedPath = []
-    pq: PriorityQueue[WeightedEdge] = PriorityQueue()
+    pq: IndexedDaryHeap = IndexedDaryHeap(wg.vertex_count)
     visited: list[bool] = [False] * wg.vertex_count
+    best_edge: list[Optional[WeightedEdge]] = [None] * wg.vertex_count
 
     def visit(index: int):
         visited[index] = True
         for edge in wg.edges_for_index(index):
-            if not visited[edge.v]:
-                pq.push(edge)
+            if visited[edge.v]:
+                continue
+            if not pq.contains(edge.v) or edge.weight < pq.key_of(edge.v):
+                best_edge[edge.v] = edge
+                pq.push_or_decrease_key(edge.v, edge.weight)
 
     visit(start)
 
     while not pq.empty:
-        edge = pq.pop()
-        if visited[edge.v]:
-            continue
-        result.append(edge)
-        visit(edge.v)
+        vertex = pq.pop()
+        result.append(best_edge[vertex])
+        visit(vertex)
     return result
 
 def print_weighted_path(wg: WeightedGraph, wp: WeightedPath) -> None:
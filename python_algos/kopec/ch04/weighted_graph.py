@@ -6,7 +6,7 @@ V = TypeVar('V')
 
 class WeightedGraph(Generic[V], Graph[V]):
     def __init__(self, vertices: list[V] = []) -> None:
-        self._vertices: list[V] = vertices
+        super().__init__(vertices)
         self._edges: list[list[WeightedEdge]] = [[] for _ in vertices]
 
     def add_edge_by_indices(self, u: int, v: int, weight: float) -> None:
@@ -14,8 +14,8 @@ class WeightedGraph(Generic[V], Graph[V]):
         self.add_edge(edge)
 
     def add_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self._vertex_to_index[first]
+        v: int = self._vertex_to_index[second]
         self.add_edge_by_indices(u, v, weight)
 
     def neighbors_for_index_with_weights(self, index: int) -> list[tuple[V, float]]:
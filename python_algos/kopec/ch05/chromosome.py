@@ -5,6 +5,8 @@ T = TypeVar('T', bound='Chromosome')
 
 class Chromosome(ABC):
 
+    # fitness must only depend on state changed through mutate/crossover,
+    # so subclasses may memoize it as long as mutate invalidates the cache
     @abstractmethod
     def fitness(self) -> float:
         ...
@@ -14,6 +16,8 @@ class Chromosome(ABC):
     def random_instance(cls: Type[T]) -> T:
         ...
 
+    # crossover runs inside the GA hot loop; subclasses should build the
+    # children with their own constructor rather than deepcopy
     @abstractmethod
     def crossover(self: T, other: T) -> tuple[T, T]:
         ...
@@ -1,63 +1,160 @@
 from __future__ import annotations
 from typing import TypeVar, Generic, Callable
 from enum import Enum
-from random import choices, random
-from heapq import nlargest
-from statistics import mean
+from random import random
+from operator import methodcaller
+
+import numpy as np
+
 from kopec.ch05.chromosome import Chromosome
 
 C = TypeVar('C', bound=Chromosome)
 
 class GeneticAlgorithm(Generic[C]):
-    SelectionType = Enum("SelectionType", "ROULETTE TOURNAMENT")
+    SelectionType = Enum("SelectionType", "ROULETTE TOURNAMENT STUD")
 
     def __init__(self, initial_population: list[C], threshold: float,
                  max_generations: int = 100, mutation_chance: float = 0.01, crossover_chance: float = 0.7,
-                 selection_type: SelectionType = SelectionType.TOURNAMENT) -> None:
+                 selection_type: SelectionType = SelectionType.TOURNAMENT,
+                 patience: int = 30, convergence_tol: float = 1e-10,
+                 verbose: bool = True, stud_rate: float = 1.0) -> None:
         self._population: list[C] = initial_population
         self._threshold: float = threshold
         self._max_generations: int = max_generations
         self._mutation_chance: float = mutation_chance
         self._crossover_chance: float = crossover_chance
         self._selection_type: GeneticAlgorithm.SelectionType = selection_type
-        self._fitness_key: Callable = type(self._population[0]).fitness
-
-    def _pick_roulette(self, wheel: list[float]) -> tuple[C, C]:
-        return tuple(choices(self._population, weights=wheel, k=2))
-    
-    def _pick_tournament(self, num_participants: int) -> tuple[C, C]:
-        participants: list[C] = choices(self._population, k=num_participants)
-        return tuple(nlargest(2, participants, key=self._fitness_key))
-    
-    def _reproduce_and_replace(self) -> None:
-        new_population: list[C] = []
-        while len(new_population) < len(self._population):
-            if self._selection_type == GeneticAlgorithm.SelectionType.ROULETTE:
-                parents: tuple[C, C] = self._pick_roulette([x.fitness() for x in self._population])
+        self._patience: int = patience
+        self._convergence_tol: float = convergence_tol
+        self._verbose: bool = verbose
+        # methodcaller dispatches in C, noticeably cheaper than calling
+        # the unbound method for a key invoked O(N) times per scan
+        self._fitness_key: Callable = methodcaller("fitness")
+        # the selection type never changes during a run, so the strategy
+        # is bound once here instead of being re-dispatched per generation
+        self._stud_rate: float = stud_rate
+        if selection_type == GeneticAlgorithm.SelectionType.ROULETTE:
+            self._select_pairs: Callable[[list[float], int], list[tuple[C, C]]] = self._roulette_pairs
+        elif selection_type == GeneticAlgorithm.SelectionType.STUD:
+            self._select_pairs = self._stud_pairs
+        else:
+            self._select_pairs = self._tournament_pairs
+
+    def _pick_roulette_indices(self, fitnesses: list[float], count: int) -> np.ndarray:
+        # draw every parent for the generation at once by inverting the
+        # fitness CDF with searchsorted; shifting by the minimum keeps
+        # the weights non-negative, which random.choices rejected
+        weights: np.ndarray = np.fromiter(fitnesses, dtype=np.float64, count=len(fitnesses))
+        minimum: float = weights.min()
+        if minimum < 0:
+            weights = weights - minimum
+        cdf: np.ndarray = np.cumsum(weights)
+        if cdf[-1] <= 0:
+            return np.random.randint(0, len(fitnesses), count)
+        return np.searchsorted(cdf, np.random.random(count) * cdf[-1])
+
+    def _pick_tournament(self, num_participants: int, fitnesses: np.ndarray) -> tuple[C, C]:
+        # tournament over sampled indices (with replacement, as before);
+        # argpartition finds the two winners in C without sorting the
+        # whole tournament or calling fitness
+        indices: np.ndarray = np.random.randint(0, len(self._population), num_participants)
+        top: np.ndarray = indices[np.argpartition(fitnesses[indices], -2)[-2:]]
+        return self._population[top[0]], self._population[top[1]]
+
+    def _roulette_pairs(self, fitnesses: list[float], pairs: int) -> list[tuple[C, C]]:
+        indices: np.ndarray = self._pick_roulette_indices(fitnesses, 2 * pairs)
+        return [(self._population[indices[i]], self._population[indices[pairs + i]])
+                for i in range(pairs)]
+
+    def _tournament_pairs(self, fitnesses: list[float], pairs: int) -> list[tuple[C, C]]:
+        fitness_array: np.ndarray = np.asarray(fitnesses)
+        num_participants: int = len(self._population) // 2
+        return [self._pick_tournament(num_participants, fitness_array)
+                for _ in range(pairs)]
+
+    def _pick_single_tournament(self, num_participants: int, fitnesses: np.ndarray) -> C:
+        indices: np.ndarray = np.random.randint(0, len(self._population), num_participants)
+        return self._population[indices[np.argmax(fitnesses[indices])]]
+
+    def _stud_pairs(self, fitnesses: list[float], pairs: int) -> list[tuple[C, C]]:
+        # stud selection: the current best individual is the first parent
+        # of (a stud_rate fraction of) every pair, which raises selection
+        # pressure and halves the per-pair selection work
+        fitness_array: np.ndarray = np.asarray(fitnesses)
+        stud: C = self._population[int(np.argmax(fitness_array))]
+        num_participants: int = len(self._population) // 2
+        parent_pairs: list[tuple[C, C]] = []
+        for _ in range(pairs):
+            if random() < self._stud_rate:
+                parent_pairs.append(
+                    (stud, self._pick_single_tournament(num_participants, fitness_array)))
             else:
-                parents = self._pick_tournament(len(self._population) // 2)
+                parent_pairs.append(self._pick_tournament(num_participants, fitness_array))
+        return parent_pairs
+
+    def _reproduce_and_replace(self, fitnesses: list[float]) -> None:
+        size: int = len(self._population)
+        pairs: int = (size + 1) // 2
+        # filled by index into a preallocated list: the loop bound is
+        # known up front, so no append-driven regrowth happens
+        new_population: list[C] = [None] * (2 * pairs)
+        for i, parents in enumerate(self._select_pairs(fitnesses, pairs)):
             if random() < self._crossover_chance:
-                new_population.extend(parents[0].crossover(parents[1]))
+                new_population[2 * i], new_population[2 * i + 1] = \
+                    parents[0].crossover(parents[1])
             else:
-                new_population.extend(parents)
-        if len(new_population) > len(self._population):
-            new_population.pop()
-        self._population = new_population
+                new_population[2 * i], new_population[2 * i + 1] = parents
+        # an odd population size produced one surplus child
+        self._population = new_population if 2 * pairs == size else new_population[:size]
 
     def _mutate(self) -> None:
-        for individual in self._population:
-            if random() < self._mutation_chance:
-                individual.mutate()
+        # one vectorized draw decides every mutation for the generation,
+        # replacing a Python-level random() call per individual
+        draws: np.ndarray = np.random.random(len(self._population))
+        for index in np.flatnonzero(draws < self._mutation_chance):
+            self._population[index].mutate()
+
+    def _evaluate(self) -> tuple[list[float], int]:
+        # one pass builds the fitness list and tracks the best index, so
+        # run() never rescans the population with max afterwards
+        fitnesses: list[float] = []
+        best_index: int = 0
+        best_fitness: float = float("-inf")
+        for index, individual in enumerate(self._population):
+            fitness: float = self._fitness_key(individual)
+            fitnesses.append(fitness)
+            if fitness > best_fitness:
+                best_fitness = fitness
+                best_index = index
+        return fitnesses, best_index
 
     def run(self) -> C:
-        best: C = max(self._population, key=self._fitness_key)
+        # fitness is evaluated once per generation; the cached list feeds
+        # the threshold test, the log line, selection and the best scan
+        fitnesses, best_index = self._evaluate()
+        best: C = self._population[best_index]
+        stagnant: int = 0
         for generation in range(self._max_generations):
-            if best.fitness() >= self._threshold:
+            best_fitness: float = self._fitness_key(best)
+            if best_fitness >= self._threshold:
                 return best
-            print(f"Generation {generation} best {best.fitness()} mean {mean(map(self._fitness_key, self._population))}")
-            self._reproduce_and_replace()
+            if self._verbose:
+                print(f"Generation {generation} best {best_fitness} "
+                      f"mean {sum(fitnesses) / len(fitnesses)}")
+            self._reproduce_and_replace(fitnesses)
             self._mutate()
-            highest: C = max(self._population, key=self._fitness_key)
-            if highest.fitness() > best.fitness():
-                best = highest
+            fitnesses, highest_index = self._evaluate()
+            if fitnesses[highest_index] > best_fitness:
+                best = self._population[highest_index]
+            # stop once the best fitness has not improved for patience
+            # generations, or when the population has collapsed to a
+            # single fitness value and selection has no gradient left
+            if fitnesses[highest_index] - best_fitness < self._convergence_tol:
+                stagnant += 1
+                if stagnant >= self._patience:
+                    break
+            else:
+                stagnant = 0
+            if fitnesses[highest_index] == min(fitnesses):
+                break
         return best
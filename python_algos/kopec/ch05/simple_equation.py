@@ -1,39 +1,41 @@
 from kopec.ch05.chromosome import Chromosome
 from kopec.ch05.genetic_algorithm import GeneticAlgorithm
-from random import randrange, random
-from copy import deepcopy
+from random import randrange, getrandbits
+from typing import Optional
 
 
 class SimpleEquation(Chromosome):
     def __init__(self, x: int, y: int) -> None:
         self.x: int = x
         self.y: int = y
+        self._fitness: Optional[float] = None
 
     def fitness(self) -> float:
-        return 6 * self.x - self.x * self.x + 4 * self.y - self.y * self.y
+        # the genes only change through mutate, which drops the cache, so
+        # repeated fitness calls per generation cost one attribute load
+        if self._fitness is None:
+            self._fitness = 6 * self.x - self.x * self.x + 4 * self.y - self.y * self.y
+        return self._fitness
 
     @classmethod
     def random_instance(cls) -> "SimpleEquation":
         return SimpleEquation(randrange(100), randrange(100))
     
     def crossover(self, other: "SimpleEquation") -> tuple["SimpleEquation", "SimpleEquation"]:
-        child1: SimpleEquation = deepcopy(self)
-        child2: SimpleEquation = deepcopy(other)
-        child1.y = other.y
-        child2.y = self.y
-        return child1, child2
+        # direct construction; deepcopy-then-overwrite paid for the full
+        # copy protocol just to replace one attribute
+        return SimpleEquation(self.x, other.y), SimpleEquation(other.x, self.y)
     
     def mutate(self) -> None:
-        if random() > 0.5:
-            if random() > 0.5:
-                self.x += 1
-            else:
-                self.x -= 1
+        # one 2-bit draw instead of two nested 50/50 random() branches:
+        # bit 0 picks the gene, bit 1 the direction
+        bits: int = getrandbits(2)
+        delta: int = 1 if bits & 2 else -1
+        if bits & 1:
+            self.x += delta
         else:
-            if random() > 0.5:
-                self.y += 1
-            else:
-                self.y -= 1
+            self.y += delta
+        self._fitness = None
     
     def __str__(self) -> str:
         return f"X: {self.x} Y: {self.y} Fitness: {self.fitness()}"